@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Any
+from typing import Any, Dict
 
 from drf_yasg.utils import swagger_serializer_method
 from gnosis.eth.django.serializers import EthereumAddressField
@@ -206,15 +206,28 @@ class ChainSerializer(serializers.ModelSerializer[Chain]):
         ]
 
     @swagger_serializer_method(serializer_or_field=CurrencySerializer)  # type: ignore[misc]
-    def get_native_currency(self, obj: Chain) -> ReturnDict[Any, Any]:
-        return CurrencySerializer(
-            obj, context={"request": self.context["request"]}
-        ).data
+    def get_native_currency(self, obj: Chain) -> Dict[str, Any]:
+        # Built inline instead of through CurrencySerializer to avoid
+        # instantiating a nested serializer per chain
+        logo_uri = None
+        if obj.currency_logo_uri:
+            logo_uri = self.context["request"].build_absolute_uri(
+                obj.currency_logo_uri.url
+            )
+        return {
+            "name": str(obj.currency_name),
+            "symbol": str(obj.currency_symbol),
+            "decimals": int(obj.currency_decimals),
+            "logo_uri": logo_uri,
+        }
 
     @staticmethod
     @swagger_serializer_method(serializer_or_field=ThemeSerializer)  # type: ignore[misc]
-    def get_theme(obj: Chain) -> ReturnDict[Any, Any]:
-        return ThemeSerializer(obj).data
+    def get_theme(obj: Chain) -> Dict[str, Any]:
+        return {
+            "text_color": str(obj.theme_text_color),
+            "background_color": str(obj.theme_background_color),
+        }
 
     @staticmethod
     @swagger_serializer_method(serializer_or_field=BaseRpcUriSerializer)  # type: ignore[misc]
@@ -238,7 +251,7 @@ class ChainSerializer(serializers.ModelSerializer[Chain]):
 
     @swagger_serializer_method(serializer_or_field=GasPriceSerializer)  # type: ignore[misc]
     def get_gas_price(self, instance: Chain) -> ReturnDict[Any, Any]:
-        ranked_gas_prices = instance.gasprice_set.all().order_by("rank")
+        ranked_gas_prices = instance.gasprice_set.all()
         return GasPriceSerializer(ranked_gas_prices, many=True).data
 
     @swagger_serializer_method(serializer_or_field=WalletSerializer)  # type: ignore[misc]
@@ -248,7 +261,7 @@ class ChainSerializer(serializers.ModelSerializer[Chain]):
 
     @swagger_serializer_method(serializer_or_field=FeatureSerializer)  # type: ignore[misc]
     def get_features(self, instance: Chain) -> ReturnDict[Any, Any]:
-        enabled_features = instance.feature_set.all().order_by("key")
+        enabled_features = instance.feature_set.all()
         return FeatureSerializer(enabled_features, many=True).data
 
     @swagger_serializer_method(serializer_or_field=PricesProviderSerializer)  # type: ignore[misc]
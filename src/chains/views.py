@@ -1,5 +1,6 @@
 from typing import Any
 
+from django.db.models import Prefetch
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import filters
 from rest_framework.generics import ListAPIView, RetrieveAPIView
@@ -7,9 +8,16 @@ from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.request import Request
 from rest_framework.response import Response
 
-from .models import Chain
+from .models import Chain, Feature, GasPrice
 from .serializers import ChainSerializer
 
+# Gas prices and features are rendered for every chain so they are prefetched
+# (already sorted) instead of being queried per chain by the serializer
+VISIBLE_CHAINS = Chain.objects.filter(hidden=False).prefetch_related(
+    Prefetch("gasprice_set", queryset=GasPrice.objects.order_by("rank")),
+    Prefetch("feature_set", queryset=Feature.objects.order_by("key")),
+)
+
 
 class ChainsPagination(LimitOffsetPagination):
     default_limit = 20
@@ -19,7 +27,7 @@ class ChainsPagination(LimitOffsetPagination):
 class ChainsListView(ListAPIView):  # type: ignore[type-arg]
     serializer_class = ChainSerializer
     pagination_class = ChainsPagination
-    queryset = Chain.objects.filter(hidden=False)
+    queryset = VISIBLE_CHAINS
     filter_backends = [filters.OrderingFilter]
     ordering_fields = ["relevance", "name"]
     ordering = [
@@ -30,7 +38,7 @@ class ChainsListView(ListAPIView):  # type: ignore[type-arg]
 
 class ChainsDetailView(RetrieveAPIView):  # type: ignore[type-arg]
     serializer_class = ChainSerializer
-    queryset = Chain.objects.filter(hidden=False)
+    queryset = VISIBLE_CHAINS
 
     @swagger_auto_schema(
         operation_id="Get chain by id"
@@ -42,7 +50,7 @@ class ChainsDetailView(RetrieveAPIView):  # type: ignore[type-arg]
 class ChainsDetailViewByShortName(RetrieveAPIView):  # type: ignore[type-arg]
     lookup_field = "short_name"
     serializer_class = ChainSerializer
-    queryset = Chain.objects.filter(hidden=False)
+    queryset = VISIBLE_CHAINS
 
     @swagger_auto_schema(
         operation_id="Get chain by shortName",